@@ -28,6 +28,9 @@ __all__ = [
 
 DEFAULT_RESOLUTION = 24
 
+# Maximum number of tracks to show in the string representation
+_MAX_REPR_TRACKS = 10
+
 MultitrackType = TypeVar("MultitrackType", bound="Multitrack")
 
 
@@ -107,7 +110,7 @@ class Multitrack:
         if tempo is None:
             self.tempo = None
         elif isinstance(tempo, int) or isinstance(tempo, float):
-            self.tempo = np.tile(tempo, (self.get_max_length(), 1)).astype(float)
+            self.tempo = np.full((self.get_max_length(), 1), tempo, float)
         elif np.issubdtype(tempo.dtype, np.floating):
             self.tempo = tempo
         else:
@@ -158,7 +161,10 @@ class Multitrack:
                 f"downbeat=array(shape={self.downbeat.shape}, "
                 f"dtype={self.downbeat.dtype})"
             )
-        to_join.append(f"tracks={repr(self.tracks)}")
+        if len(self.tracks) > _MAX_REPR_TRACKS:
+            to_join.append(f"tracks=[<{len(self.tracks)} tracks>]")
+        else:
+            to_join.append(f"tracks={repr(self.tracks)}")
         return f"Multitrack({', '.join(to_join)})"
 
     def _validate_type(self, attr):
@@ -256,8 +262,8 @@ class Multitrack:
             if np.any(self.tempo <= 0.0):
                 raise ValueError("`tempo` must contain only positive numbers.")
         elif attr == "beat":
-            if self.beat.ndim != 1:
-                raise ValueError("`beat` must be a 1D NumPy array.")
+            if self.beat.ndim != 2 or self.beat.shape[1] != 1:
+                raise ValueError("`beat` must be a 2D NumPy array of shape (?,1).")
         elif attr == "downbeat":
             if self.downbeat.ndim != 2 or self.downbeat.shape[1] != 1:
                 raise ValueError("`downbeat` must be a 2D NumPy array of shape (?,1).")
@@ -363,12 +369,7 @@ class Multitrack:
             trailing silence.
 
         """
-        active_length = 0
-        for track in self.tracks:
-            now_length = track.get_length()
-            if active_length < track.get_length():
-                active_length = now_length
-        return active_length
+        return max((track.get_length() for track in self.tracks), default=0)
 
     def get_max_length(self) -> int:
         """Return the maximum length of the piano rolls.
@@ -379,11 +380,9 @@ class Multitrack:
             Maximum length (in time steps) of the piano rolls.
 
         """
-        max_length = 0
-        for track in self.tracks:
-            if max_length < track.pianoroll.shape[0]:
-                max_length = track.pianoroll.shape[0]
-        return max_length
+        return max(
+            (track.pianoroll.shape[0] for track in self.tracks), default=0
+        )
 
     def get_beat_steps(self) -> ndarray:
         """Return the indices of time steps that contain beats.
@@ -396,7 +395,7 @@ class Multitrack:
         """
         if self.beat is None:
             return np.array([])
-        return np.nonzero(self.beat)[0]
+        return np.flatnonzero(self.beat)
 
     def get_downbeat_steps(self) -> ndarray:
         """Return the indices of time steps that contain downbeats.
@@ -409,7 +408,7 @@ class Multitrack:
         """
         if self.downbeat is None:
             return np.array([])
-        return np.nonzero(self.downbeat)[0]
+        return np.flatnonzero(self.downbeat)
 
     def set_nonzeros(self: MultitrackType, value: int) -> MultitrackType:
         """Assign a constant value to all nonzero entries.
@@ -462,18 +461,18 @@ class Multitrack:
         self.downbeat[downbeats] = True
         # Iterate over each track
         for track in self.tracks:
-            time, pitch = track.pianoroll.nonzero()
+            pianoroll = track.pianoroll
+            time, pitch = pianoroll.nonzero()
             if len(time) < 1:
                 continue
-            if track.pianoroll.dtype == np.bool_:
+            if pianoroll.dtype == np.bool_:
                 value = 1
             else:
-                value = track.pianoroll[time, pitch]
+                value = pianoroll[time, pitch]
             rounded_time = _round_time(time, factor, rounding)
-            track.pianoroll = np.zeros(
-                (rounded_end_time + 1, 128), track.pianoroll.dtype
-            )
-            track.pianoroll[rounded_time, pitch] = value
+            resized = np.zeros((rounded_end_time + 1, 128), pianoroll.dtype)
+            resized[rounded_time, pitch] = value
+            track.pianoroll = resized
         # Set the new resolution
         self.resolution = resolution
         return self
@@ -523,19 +522,12 @@ class Multitrack:
 
         """
         max_length = self.get_max_length()
-        pianorolls = []
-        for track in self.tracks:
-            if track.pianoroll.shape[0] < max_length:
-                pad_length = max_length - track.pianoroll.shape[0]
-                padded = np.pad(
-                    track.pianoroll,
-                    ((0, pad_length), (0, 0)),
-                    "constant",
-                )
-                pianorolls.append(padded)
-            else:
-                pianorolls.append(track.pianoroll)
-        return np.stack(pianorolls)
+        dtype = np.result_type(*(track.pianoroll for track in self.tracks))
+        stacked = np.zeros((len(self.tracks), max_length, 128), dtype)
+        for i, track in enumerate(self.tracks):
+            pianoroll = track.pianoroll
+            stacked[i, : pianoroll.shape[0]] = pianoroll
+        return stacked
 
     def blend(self, mode: str = None) -> ndarray:
         """Return the blended pianoroll.
@@ -552,14 +544,47 @@ class Multitrack:
             Blended piano roll.
 
         """
-        stacked = self.stack()
-        if mode is None or mode.lower() == "sum":
-            return np.sum(stacked, axis=0).clip(0, 127).astype(np.uint8)
-        if mode.lower() == "any":
-            return np.any(stacked, axis=0)
-        if mode.lower() == "max":
-            return np.max(stacked, axis=0)
-        raise ValueError("`mode` must be one of 'max', 'sum' or 'any'.")
+        if mode is None:
+            mode = "sum"
+        mode = mode.lower()
+        if mode not in ("sum", "any", "max"):
+            raise ValueError("`mode` must be one of 'max', 'sum' or 'any'.")
+
+        # Reduce the piano rolls one at a time into a single buffer
+        # rather than materializing the stacked tensor
+        max_length = self.get_max_length()
+        dtype = np.result_type(*(track.pianoroll for track in self.tracks))
+        if mode == "sum":
+            # A uint16 accumulator cannot overflow for up to 257 binary
+            # or uint8 piano rolls
+            if dtype in (np.bool_, np.uint8) and len(self.tracks) <= 257:
+                acc_dtype = np.dtype(np.uint16)
+            else:
+                acc_dtype = np.result_type(dtype, np.int32)
+            blended = np.zeros((max_length, 128), acc_dtype)
+            ufunc = np.add
+        elif mode == "any":
+            blended = np.zeros((max_length, 128), bool)
+            ufunc = np.logical_or
+        else:
+            # Time steps covered by every track take their true maximum,
+            # while the rest are compared against the zero padding
+            blended = np.zeros((max_length, 128), dtype)
+            min_length = min(track.pianoroll.shape[0] for track in self.tracks)
+            if np.issubdtype(dtype, np.integer):
+                blended[:min_length] = np.iinfo(dtype).min
+            elif np.issubdtype(dtype, np.floating):
+                blended[:min_length] = -np.inf
+            ufunc = np.maximum
+        for track in self.tracks:
+            pianoroll = track.pianoroll
+            out = blended[: pianoroll.shape[0]]
+            ufunc(out, pianoroll, out=out, casting="unsafe")
+
+        if mode == "sum":
+            np.clip(blended, 0, 127, out=blended)
+            return blended.astype(np.uint8)
+        return blended
 
     def copy(self):
         """Return a copy of the multitrack.
@@ -722,15 +747,14 @@ class Multitrack:
         """
         max_length = self.get_max_length()
         for track in self.tracks:
-            if track.pianoroll.shape[0] < max_length:
-                track.pad(max_length - track.pianoroll.shape[0])
+            length = track.pianoroll.shape[0]
+            if length < max_length:
+                track.pad(max_length - length)
         return self
 
     def remove_empty(self: MultitrackType) -> MultitrackType:
         """Remove tracks with empty pianorolls."""
-        self.tracks = [
-            track for track in self.tracks if not np.any(track.pianoroll)
-        ]
+        self.tracks = [track for track in self.tracks if track.pianoroll.any()]
         return self
 
     def transpose(self: MultitrackType, semitone: int) -> MultitrackType:
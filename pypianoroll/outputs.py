@@ -17,7 +17,6 @@ Variable
 import json
 import zipfile
 from fractions import Fraction
-from copy import deepcopy
 from operator import attrgetter
 from pathlib import Path
 from typing import TYPE_CHECKING, Dict, Union
@@ -175,15 +174,14 @@ def to_pretty_midi(
             program=track.program, is_drum=track.is_drum, name=track.name
         )
         if isinstance(track, BinaryTrack):
-            processed = track.set_nonzeros(default_velocity)
+            processed = track.set_nonzeros(default_velocity).pianoroll
         elif isinstance(track, StandardTrack):
-            copied = deepcopy(track)
-            processed = copied.clip()
+            processed = track.pianoroll.clip(0, 127)
         else:
             raise ValueError(
                 f"Expect BinaryTrack or StandardTrack, but got {type(track)}."
             )
-        clipped = processed.pianoroll.astype(np.uint8)
+        clipped = processed.astype(np.uint8)
         binarized = clipped > 0
         padded = np.pad(binarized, ((1, 1), (0, 0)), "constant")
         diff = np.diff(padded.astype(np.int8), axis=0)
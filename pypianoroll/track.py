@@ -359,7 +359,8 @@ class Track:
             raise ValueError(
                 "`end` must be shorter than the piano roll length."
             )
-        self.pianoroll = self.pianoroll[start:end]
+        if start > 0 or end < len(self.pianoroll):
+            self.pianoroll = self.pianoroll[start:end]
         return self
 
     def standardize(self: "Track") -> "StandardTrack":
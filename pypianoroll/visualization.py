@@ -474,14 +474,16 @@ def plot_multitrack(
             plt.legend(handles=patches)
 
     elif mode == "hybrid":
-        drums = multitrack.copy()
-        drums.tracks = [track for track in multitrack.tracks if track.is_drum]
+        # Wrap the track subsets directly rather than copying the whole
+        # multitrack
+        drums = type(multitrack)(
+            tracks=[track for track in multitrack.tracks if track.is_drum]
+        )
         merged_drums = drums.blend()
 
-        others = multitrack.copy()
-        others.tracks = [
-            track for track in multitrack.tracks if not track.is_drum
-        ]
+        others = type(multitrack)(
+            tracks=[track for track in multitrack.tracks if not track.is_drum]
+        )
         merged_others = others.blend()
 
         if axs is None: